@@ -3,15 +3,15 @@ import sublime_plugin
 
 import hashlib
 import htmlmin
-import json
 import sys
+from collections import namedtuple
 from http.client import CannotSendRequest
 from jinja2 import Template
-from os.path import realpath
+from os.path import realpath, splitext
 from threading import Lock
 from urllib.parse import quote
 
-from ..lib import deferred, keymap, link_opener, logger, settings, requests, languages
+from ..lib import deferred, jsonutil, keymap, link_opener, logger, settings, requests, languages
 from ..lib.errors import ExpectedError
 from ..lib.file_system import path_for_url
 from ..lib.codenav import RelatedCodeLinePhantom
@@ -30,16 +30,75 @@ __all__ = [
 ]
 
 
+# Frozen at import time since this is checked on every modification and
+# selection event - a single splitext plus a set lookup keeps the check cheap.
+_SUPPORTED_EXTS = frozenset(languages.SUPPORTED_EXTS)
+
+
 def _is_view_supported(view):
-    return view.file_name() is not None and any(
-        view.file_name().endswith(ext) for ext in languages.SUPPORTED_EXTS
-    )
+    file_name = view.file_name()
+    if file_name is None:
+        return False
+
+    ext = splitext(file_name)[1]
+    if ext not in _SUPPORTED_EXTS:
+        return False
+
+    # Extensions with a known language mapping are additionally gated on the
+    # copilot having that language enabled. The check is TTL-cached, so it is
+    # a dict lookup on all but the first call in a window. Extensions without
+    # a mapping stay supported unconditionally, as before.
+    if ext in languages.EXTS_TO_LANG:
+        return languages.kited_ext_enabled(ext)
+    return True
+
+
+_PYTHON_EXTS = frozenset([languages.Extensions.PY, languages.Extensions.PYW])
+
+
+def _is_python_view(view):
+    file_name = view.file_name()
+    return (file_name is not None and
+            splitext(file_name)[1] in _PYTHON_EXTS)
 
 
 def _check_view_size(view):
     return view.size() <= MAX_FILE_SIZE
 
 
+# Maps view ids to `(change_count, text)` tuples so that events which do not
+# modify the buffer (selections, hovers, signature requests) can reuse the
+# text extracted by the last event instead of copying the whole buffer out of
+# the view again.
+_BUFFER_CACHE = {}
+
+
+def _view_text(view):
+    view_id = view.id()
+    change_count = view.change_count()
+    cached = _BUFFER_CACHE.get(view_id)
+    if cached is not None and cached[0] == change_count:
+        return cached[1]
+
+    text = view.substr(sublime.Region(0, view.size()))
+    _BUFFER_CACHE[view_id] = (change_count, text)
+    return text
+
+
+# Maps file names to their resolved real paths. `realpath` stats every path
+# component to resolve symlinks, and the result only changes if the file is
+# renamed (which produces a new key) or symlinks are rearranged underneath
+# the editor, so the resolution is done once per file name.
+_REALPATH_CACHE = {}
+
+
+def _cached_realpath(file_name):
+    path = _REALPATH_CACHE.get(file_name)
+    if path is None:
+        path = _REALPATH_CACHE.setdefault(file_name, realpath(file_name))
+    return path
+
+
 def _get_view_substr(view, start, end):
     return view.substr(sublime.Region(start, end))
 
@@ -49,25 +108,32 @@ def _get_word(view, point):
     return _get_view_substr(view, word_region.a, word_region.b)
 
 
-def _in_function_call(view, point):
+def _in_function_call(view, point, scope=None):
     # The first matched scope is for 3176, and the second is for 3200. Both
     # are checked here as a hacky fix to account for changes in the API. We
     # should instead factor version handling logic into a separate module.
-    return ((view.match_selector(point, 'meta.function-call.python') or
-             view.match_selector(point, 'meta.function-call.arguments.python'))
-            and not view.match_selector(point, 'variable.function.python'))
+    #
+    # A single scope_name call replaces what used to be three match_selector
+    # evaluations - for these simple selectors, membership in the scope
+    # stack string is equivalent and avoids re-parsing the scopes at the
+    # point for each selector.
+    if scope is None:
+        scope = view.scope_name(point)
+    return (('meta.function-call.python' in scope or
+             'meta.function-call.arguments.python' in scope)
+            and 'variable.function.python' not in scope)
 
 
 def _at_function_call_begin(view, point):
-    return (_in_function_call(view, point) and
-            view.match_selector(point,
-                                'punctuation.section.arguments.begin.python'))
+    scope = view.scope_name(point)
+    return (_in_function_call(view, point, scope) and
+            'punctuation.section.arguments.begin.python' in scope)
 
 
 def _at_function_call_end(view, point):
-    return (_in_function_call(view, point) and
-            view.match_selector(point,
-                                'punctuation.section.arguments.end.python'))
+    scope = view.scope_name(point)
+    return (_in_function_call(view, point, scope) and
+            'punctuation.section.arguments.end.python' in scope)
 
 
 def _in_empty_function_call(view, point):
@@ -79,6 +145,12 @@ def _md5(text):
     return hashlib.md5(str.encode(text)).hexdigest()
 
 
+# A selection or edit region. A namedtuple rather than a dict since one is
+# created per modification and selection event - allocation is cheaper and
+# field access compiles down to an index load.
+_Region = namedtuple('_Region', ['file', 'begin', 'end'])
+
+
 class EventDispatcher(sublime_plugin.EventListener):
     """Listener which forwards editor events to the event endpoint and also
     fetches completions and function signature information when the proper
@@ -87,14 +159,50 @@ class EventDispatcher(sublime_plugin.EventListener):
 
     _last_selection_region = None
 
+    # Edit events are debounced so that a burst of keystrokes results in a
+    # single event post and completions/signatures request instead of one
+    # per keystroke. `sublime.set_timeout_async` does not return a cancelable
+    # handle, so a monotonically increasing token is used to drop all but the
+    # most recent pending callback.
+    _edit_token = 0
+    _DEBOUNCE_MS = 20
+
     def on_modified(self, view):
-        self.__class__._handle(view, 'edit')
+        cls = self.__class__
+        cls._edit_token += 1
+        token = cls._edit_token
+        # Snapshot the pre-edit selection now: the selection event that
+        # follows this edit updates _last_selection_region to the post-edit
+        # caret before the debounced callback runs, and _edit_info needs the
+        # selection as it was before the edit to classify it.
+        selection = cls._last_selection_region
+        sublime.set_timeout_async(
+            lambda: cls._handle_debounced(view, token, selection),
+            cls._DEBOUNCE_MS)
 
     def on_selection_modified(self, view):
-        self.__class__._handle(view, 'selection')
+        # Hop to the async thread immediately so that not even the region
+        # bookkeeping or the queue push runs inside the synchronous event
+        # callback - the main thread goes straight back to the render loop.
+        cls = self.__class__
+        sublime.set_timeout_async(lambda: cls._handle_selection(view), 0)
+
+    def on_close(self, view):
+        # Closed views never produce events again, so drop their cached
+        # buffer text - without this the cache would retain up to
+        # MAX_FILE_SIZE of text per view for the life of the plugin host.
+        _BUFFER_CACHE.pop(view.id(), None)
 
     @classmethod
-    def _handle(cls, view, action):
+    def _handle_debounced(cls, view, token, selection):
+        # A newer edit has re-armed the timer - only the trailing callback
+        # in a burst does any work.
+        if token != cls._edit_token:
+            return
+        cls._handle_edit(view, selection)
+
+    @classmethod
+    def _handle_selection(cls, view):
         if not _is_view_supported(view):
             return
 
@@ -102,40 +210,83 @@ class EventDispatcher(sublime_plugin.EventListener):
         # See https://github.com/SublimeTextIssues/Core/issues/289
         view = sublime.active_window().active_view()
 
+        select_region = cls._view_region(view)
+
+        # Sublime also fires selection events for redraws and other
+        # non-movements. When the region has not actually changed there
+        # is nothing new to report, so skip the dispatch entirely rather
+        # than pushing a redundant event through the queue.
+        if (select_region is not None and
+                select_region == cls._last_selection_region):
+            return
+
         deferred.defer(requests.kited_post, '/clientapi/editor/event',
-                       data=cls._event_data(view, action))
+                       data=cls._event_data(view, 'selection'))
 
-        if action == 'selection':
-            select_region = cls._view_region(view)
-            cls._last_selection_region = select_region
+        cls._last_selection_region = select_region
 
-            if (select_region is not None and
-                    _in_function_call(view, select_region['end'])):
-                if SignaturesHandler.is_activated():
-                    SignaturesHandler.queue_signatures(view,
-                                                       select_region['end'])
-            else:
-                SignaturesHandler.hide_signatures(view)
-
-        if action == 'edit' and _check_view_size(view):
-            edit_region = cls._view_region(view)
-            edit_type, num_chars = cls._edit_info(cls._last_selection_region,
-                                                  edit_region)
-            if edit_type == 'insertion' and num_chars == 1:
-                if view.settings().get('auto_complete'):
-                    CompletionsHandler.queue_completions(view,
-                                                         edit_region['end'])
-            elif edit_type == 'deletion' and num_chars > 1:
+        # Signatures only exist for Python, so the scope inspection is
+        # skipped outright for other supported languages.
+        if (select_region is not None and _is_python_view(view) and
+                _in_function_call(view, select_region.end)):
+            if SignaturesHandler.is_activated():
+                SignaturesHandler.queue_signatures(view, select_region.end)
+        else:
+            SignaturesHandler.hide_signatures(view)
+
+    @classmethod
+    def _handle_edit(cls, view, selection):
+        if not _is_view_supported(view):
+            return
+
+        # Workaround to handle cloned views
+        # See https://github.com/SublimeTextIssues/Core/issues/289
+        view = sublime.active_window().active_view()
+
+        event_data = cls._event_data(view, 'edit')
+
+        if not _check_view_size(view):
+            deferred.defer(requests.kited_post, '/clientapi/editor/event',
+                           data=event_data)
+            return
+
+        edit_region = cls._view_region(view)
+        edit_type, num_chars = cls._edit_info(selection, edit_region)
+
+        # When an edit triggers a completions request, the editor event
+        # is bundled into the same deferred job as the completions
+        # request so the keystroke produces one dispatch instead of two
+        # back-to-back round-trips carrying the same buffer text.
+        event_queued = False
+        if edit_type == 'insertion' and num_chars == 1:
+            if (view.settings().get('auto_complete') and
+                    not CompletionsHandler.serve_from_cache(
+                        view, edit_region.end)):
+                CompletionsHandler.queue_completions(view,
+                                                     edit_region.end,
+                                                     event_data=event_data)
+                event_queued = True
+        else:
+            # Any other edit - a paste, snippet expansion, deletion, or
+            # same-length replacement - shifts text in ways the cached
+            # completions cannot account for, so the local serve chain must
+            # not survive it.
+            CompletionsHandler.break_serve_chain()
+            if edit_type == 'deletion' and num_chars > 1:
                 CompletionsHandler.hide_completions(view)
 
-            if (edit_region is not None
-                    and _in_function_call(view, edit_region['end'])):
-                if (settings.get('show_function_signatures', True) or
-                        SignaturesHandler.is_activated()):
-                    SignaturesHandler.queue_signatures(view,
-                                                       edit_region['end'])
-            else:
-                SignaturesHandler.hide_signatures(view)
+        if not event_queued:
+            deferred.defer(requests.kited_post, '/clientapi/editor/event',
+                           data=event_data)
+
+        if (edit_region is not None and _is_python_view(view)
+                and _in_function_call(view, edit_region.end)):
+            if (settings.get('show_function_signatures', True) or
+                    SignaturesHandler.is_activated()):
+                SignaturesHandler.queue_signatures(view,
+                                                   edit_region.end)
+        else:
+            SignaturesHandler.hide_signatures(view)
 
     @staticmethod
     def _view_region(view):
@@ -143,38 +294,38 @@ class EventDispatcher(sublime_plugin.EventListener):
             return None
 
         r = view.sel()[0]
-        return {
-            'file': view.file_name(),
-            'begin': r.begin(),
-            'end': r.end(),
-        }
+        return _Region(view.file_name(), r.begin(), r.end())
 
     @staticmethod
     def _edit_info(selection, edit):
         no_info = (None, None)
 
         if (selection is None or edit is None or
-                selection['file'] != edit['file']):
+                selection.file != edit.file):
             return no_info
 
-        if edit['end'] > selection['end']:
-            return 'insertion', edit['end'] - selection['end']
-        if edit['end'] < selection['end']:
-            return 'deletion', selection['end'] - edit['end']
+        if edit.end > selection.end:
+            return 'insertion', edit.end - selection.end
+        if edit.end < selection.end:
+            return 'deletion', selection.end - edit.end
 
         return no_info
 
     @staticmethod
     def _event_data(view, action):
-        text = view.substr(sublime.Region(0, view.size()))
-
-        if not _check_view_size(view):
+        # Oversized buffers are never sent, so short-circuit to the skip
+        # payload before touching the text - materializing a multi-MiB
+        # substring only to throw it away would be the worst-case allocation
+        # on the keystroke path.
+        if view.size() > MAX_FILE_SIZE:
             action = 'skip'
             text = ''
+        else:
+            text = _view_text(view)
 
         return {
             'source': 'sublime3',
-            'filename': realpath(view.file_name()),
+            'filename': _cached_realpath(view.file_name()),
             'text': text,
             'action': action,
             'selections': [{'start': r.a, 'end': r.b, 'encoding': 'utf-32'} for r in view.sel()],
@@ -189,7 +340,21 @@ class CompletionsHandler(sublime_plugin.EventListener):
     command.
     """
 
-    _lock = Lock()
+    # State below is shared between the single worker thread that stores
+    # responses and the UI thread that consumes them. There is deliberately
+    # no lock: each attribute assignment is atomic under the GIL, the
+    # producer publishes the raw/flattened lists before the location readers
+    # key off, and readers snapshot the attributes into locals before using
+    # them. This keeps the UI thread from ever waiting on the HTTP thread.
+
+    # Monotonic sequence numbers used to drop out-of-order responses. Each
+    # queued request is stamped with an incremented `_request_seq`, and
+    # responses carrying a sequence number below `_latest_seq` are discarded
+    # so that a slow response from an older request can never replace a
+    # fresher one. Responses requested at a cursor position the caret has
+    # since left are dropped by the position check in _request_completions.
+    _request_seq = 0
+    _latest_seq = 0
 
     # The last buffer location at which completions were requested. This value
     # gets updated on every completions request, regardless of whether or not
@@ -206,6 +371,11 @@ class CompletionsHandler(sublime_plugin.EventListener):
     # or not a new set of completions are initialized.
     _last_received_completions = []
 
+    # The flattened and branded form of `_last_received_completions`, built
+    # on the worker thread as soon as a response arrives so that
+    # `on_query_completions` only has to hand a prebuilt list to the UI.
+    _last_received_flattened = []
+
     # The last character that triggered completions. This value gets updated on
     # every completions request.
     _last_trigger_char = None
@@ -224,6 +394,18 @@ class CompletionsHandler(sublime_plugin.EventListener):
     # changed when a new set of completions is sent back to the UI.
     _last_init_completions = []
 
+    # The flattened and branded form of `_last_init_completions`.
+    _last_init_flattened = []
+
+    # A `(view_id, location)` tuple marking how far the last received
+    # completions can still serve the UI locally. It starts at the view and
+    # location completions were requested at and advances by one for each
+    # identifier character typed directly after it; any other edit, a cursor
+    # jump, or a view switch breaks the chain. While the chain is intact,
+    # Sublime's own fuzzy filtering narrows the visible list and no new
+    # request is needed.
+    _cache_serve_state = None
+
     def on_query_completions(self, view, prefix, locations):
         # Prevent completions from showing up in non-active views
         if sublime.active_window().active_view().id() != view.id():
@@ -240,30 +422,34 @@ class CompletionsHandler(sublime_plugin.EventListener):
         if len(locations) != 1:
             return None
 
-        with cls._lock:
-            if cls._last_location is None:
-                cls._last_received_completions = []
-                cls._last_init_completions = []
-                cls._last_location = None
-                cls.queue_completions(view, locations[0])
-                return None
-
-            if (cls._last_location != locations[0]
-                    and cls._last_received_completions):
-                logger.debug('completions location mismatch: {} != {}'
-                             .format(cls._last_location, locations[0]))
-                cls._clear_cache()
-
-            completions = None
-            if (cls._last_location == locations[0] and
-                    cls._last_received_completions):
-                completions = self._flatten_completions(
-                    cls._last_received_completions)
-                cls._last_init_completions = cls._last_received_completions
-                cls._last_init_location = cls._last_location
-                cls._last_init_prefix = prefix
-
-            return completions
+        # Snapshot the shared state into locals so the producer swapping in
+        # a new set of completions mid-callback cannot tear the reads.
+        last_location = cls._last_location
+        received = cls._last_received_completions
+        flattened = cls._last_received_flattened
+
+        if last_location is None:
+            cls._last_received_completions = []
+            cls._last_received_flattened = []
+            cls._last_init_completions = []
+            cls._last_init_flattened = []
+            cls.queue_completions(view, locations[0])
+            return None
+
+        if last_location != locations[0] and received:
+            logger.debug('completions location mismatch: {} != {}'
+                         .format(last_location, locations[0]))
+            cls._clear_cache()
+
+        completions = None
+        if last_location == locations[0] and received:
+            completions = flattened
+            cls._last_init_completions = received
+            cls._last_init_flattened = flattened
+            cls._last_init_location = last_location
+            cls._last_init_prefix = prefix
+
+        return completions
 
     def on_post_text_command(self, view, command_name, args):
         if command_name not in ('prev_field', 'next_field',
@@ -291,19 +477,63 @@ class CompletionsHandler(sublime_plugin.EventListener):
             if settings.get('replace_text_after_commit_completion', True):
                 cls._process_replace_text(view, region)
             cls._last_init_completions = []
+            cls._last_init_flattened = []
             cls._last_init_prefix = None
             cls._last_location = None
+            cls._cache_serve_state = None
             logger.debug('cleared completions')
 
     @classmethod
-    def queue_completions(cls, view, location):
+    def queue_completions(cls, view, location, event_data=None):
+        cls._request_seq += 1
         deferred.defer(cls._request_completions,
-                       view, cls._event_data(view, location))
+                       view, cls._event_data(view, location),
+                       cls._request_seq, event_data)
+
+    @classmethod
+    def serve_from_cache(cls, view, location):
+        """Returns True if the character typed at the given location merely
+        extends the identifier prefix of the last completions request, in
+        which case the cached completions still apply and no request needs
+        to be dispatched. Trigger characters (`.`), whitespace, cursor
+        jumps, and view switches all break the chain and force a fresh
+        request - and once broken, the chain stays broken so a later edit
+        at a coincident offset cannot resurrect it.
+        """
+        state = cls._cache_serve_state
+        if state is None:
+            return False
+
+        view_id, serve_location = state
+        if (view_id != view.id() or
+                not cls._last_received_completions or
+                location != serve_location + 1):
+            cls._cache_serve_state = None
+            return False
+
+        typed = _get_view_substr(view, location - 1, location)
+        if not (typed.isalnum() or typed == '_'):
+            cls._cache_serve_state = None
+            return False
+
+        # Mirror the bookkeeping a re-request would have done so the
+        # replace-text logic at commit time sees a consistent state.
+        cls._cache_serve_state = (view_id, location)
+        cls._last_location = location
+        cls._last_prefix = _get_word(view, location)
+        return True
+
+    @classmethod
+    def break_serve_chain(cls):
+        """Breaks the local serve chain so that the next keystroke dispatches
+        a fresh request instead of reusing cached completions. Called for
+        edits the chain cannot account for, e.g. pastes and replacements.
+        """
+        cls._cache_serve_state = None
 
     @classmethod
     def hide_completions(cls, view):
-        with cls._lock:
-            cls._clear_cache()
+        cls._clear_cache()
         view.run_command('hide_auto_complete')
 
     @classmethod
@@ -460,28 +690,59 @@ class CompletionsHandler(sublime_plugin.EventListener):
         return settings.get('enable_snippets', True)
 
     @classmethod
-    def _request_completions(cls, view, data):
+    def _request_completions(cls, view, data, seq, event_data=None):
         logger.debug('fetching completions')
-        resp, body = requests.kited_post('/clientapi/editor/complete', data)
+        if event_data is not None:
+            results = requests.kited_post_batch([
+                ('/clientapi/editor/event', event_data),
+                ('/clientapi/editor/complete', data),
+            ])
+            resp, body = results[-1]
+        else:
+            resp, body = requests.kited_post('/clientapi/editor/complete',
+                                             data)
 
         if resp.status != 200 or not body:
             logger.debug('no completions!')
             return
 
-        resp_data = json.loads(body.decode('utf-8'))
+        resp_data = jsonutil.loads(body)
         completions = resp_data['completions'] or []
         logger.debug('received completions: {}'
                      .format(cls._completions_str(completions,
                                                   display_only=True)))
-        with cls._lock:
-            cls._last_received_completions = completions
-            cls._last_location = data['position']['end']
-            cls._augment_completions_replace(view, cls._last_location,
-                                             cls._last_received_completions)
-
-        # Setting the last prefix inside the lock seems to hang on Linux and
-        # Windows so we do it outside. Using Sublime's view API inside the
-        # lock may be the reason.
+        if seq < cls._latest_seq:
+            logger.debug('dropping stale completions: {} < {}'
+                         .format(seq, cls._latest_seq))
+            return
+        cls._latest_seq = seq
+
+        position = data['position']['end']
+
+        # Drop responses requested at a position the cursor has since left,
+        # mirroring the position check in _request_signatures. Comparing at
+        # response time avoids racing against selection handling, which runs
+        # asynchronously. The file is compared too - the same offset in a
+        # different view says nothing about this request's staleness.
+        current = EventDispatcher._last_selection_region
+        if current is not None and (current.file != view.file_name() or
+                                    current.end != position):
+            logger.debug('dropping completions for stale position: {} != {}'
+                         .format(position, current.end))
+            return
+
+        cls._augment_completions_replace(view, position, completions)
+
+        # Flatten here, on the worker thread, so the UI thread never has to
+        # walk and brand the completions tree itself. The lists are published
+        # before the location so a reader that sees the new location also
+        # sees the completions that belong to it.
+        flattened = cls._flatten_completions(completions)
+        cls._last_received_completions = completions
+        cls._last_received_flattened = flattened
+        cls._last_location = position
+        cls._cache_serve_state = (view.id(), position)
+
         cls._last_prefix = _get_word(view, data['position']['end'])
         cls._last_trigger_char = _get_view_substr(view,
                                                   data['position']['end'] - 1,
@@ -519,10 +780,9 @@ class CompletionsHandler(sublime_plugin.EventListener):
         # filter the completions for us automatically. Note that Sublime
         # performs fuzzy matching so it is possible that Kite will suggest
         # completions that aren't exactly prefix matched.
-        with cls._lock:
-            if len(cls._last_received_completions) == 0:
-                logger.debug('nothing to do: no new completions')
-                return
+        if len(cls._last_received_completions) == 0:
+            logger.debug('nothing to do: no new completions')
+            return
 
         # It seems like the `auto_complete` command does not always result in
         # `on_query_completions` from being triggered if a completion list is
@@ -546,10 +806,8 @@ class CompletionsHandler(sublime_plugin.EventListener):
 
     @classmethod
     def _is_completions_subset(cls):
-        with cls._lock:
-            # both sets of completions are in the Kite's original data format
-            previous = cls._flatten_completions(cls._last_init_completions)
-            current = cls._flatten_completions(cls._last_received_completions)
+        previous = cls._last_init_flattened
+        current = cls._last_received_flattened
 
         if len(previous) == 0 or len(current) > len(previous):
             return False
@@ -564,12 +822,15 @@ class CompletionsHandler(sublime_plugin.EventListener):
     @classmethod
     def _clear_cache(cls):
         cls._last_location = None
+        cls._cache_serve_state = None
         cls._last_prefix = None
         cls._last_trigger_char = None
         cls._last_received_completions = []
+        cls._last_received_flattened = []
         cls._last_init_location = None
         cls._last_init_prefix = None
         cls._last_init_completions = []
+        cls._last_init_flattened = []
 
     @staticmethod
     def _completions_equal(lhs, rhs):
@@ -619,10 +880,15 @@ class CompletionsHandler(sublime_plugin.EventListener):
             return completion['snippet']['text']
         return text
 
-    @staticmethod
-    def _brand_completion(symbol, hint=None):
-        return ('{}\t{} ⟠'.format(symbol, hint) if hint
-                else '{}\t⟠'.format(symbol))
+    # Bound format methods hoisted to class scope so branding each item in a
+    # completions list does not re-create the format string per item.
+    _FMT_WITH_HINT = '{}\t{} ⟠'.format
+    _FMT_NO_HINT = '{}\t⟠'.format
+
+    @classmethod
+    def _brand_completion(cls, symbol, hint=None):
+        return (cls._FMT_WITH_HINT(symbol, hint) if hint
+                else cls._FMT_NO_HINT(symbol))
 
     @classmethod
     def _event_data(cls, view, location):
@@ -632,9 +898,9 @@ class CompletionsHandler(sublime_plugin.EventListener):
             a, b = location, location
 
         return {
-            'filename': realpath(view.file_name()),
+            'filename': _cached_realpath(view.file_name()),
             'editor': 'sublime3',
-            'text': view.substr(sublime.Region(0, view.size())),
+            'text': _view_text(view),
             'offset_encoding': 'utf-32',
             'position': {
                 'begin': a,
@@ -646,9 +912,9 @@ class CompletionsHandler(sublime_plugin.EventListener):
     @staticmethod
     def _event_data_old(view, location):
         return {
-            'filename': realpath(view.file_name()),
+            'filename': _cached_realpath(view.file_name()),
             'editor': 'sublime3',
-            'text': view.substr(sublime.Region(0, view.size())),
+            'text': _view_text(view),
             'cursor_runes': location,
         }
 
@@ -705,6 +971,17 @@ class SignaturesHandler(sublime_plugin.EventListener):
     _css_path = 'Packages/KiteSublime/lib/assets/styles.css'
     _css = ''
 
+    # Memoizes the last rendered popup. Running the call through Jinja and
+    # htmlmin is expensive enough to be worth skipping when the same call
+    # state would produce identical output, e.g. repeated signature events
+    # while the cursor stays on the same argument.
+    _last_render_key = None
+    _last_render_content = None
+
+    # The content currently shown in the popup, used to avoid re-showing an
+    # identical popup (which causes flicker) when it is already visible.
+    _last_popup_content = None
+
     def on_post_text_command(self, view, command_name, args):
         if command_name in ('kite_toggle_popular_patterns',
                             'kite_toggle_keyword_arguments'):
@@ -739,6 +1016,7 @@ class SignaturesHandler(sublime_plugin.EventListener):
                 cls._activated = False
                 cls._view = None
                 cls._call = None
+                cls._last_popup_content = None
                 reset = True
             cls._lock.release()
 
@@ -753,6 +1031,7 @@ class SignaturesHandler(sublime_plugin.EventListener):
                 cls._activated = False
                 cls._view = None
                 cls._call = None
+                cls._last_popup_content = None
                 reset = True
             cls._lock.release()
 
@@ -776,7 +1055,7 @@ class SignaturesHandler(sublime_plugin.EventListener):
                 cls.hide_signatures(view)
             return
 
-        resp_data = json.loads(body.decode('utf-8'))
+        resp_data = jsonutil.loads(body)
         calls = resp_data['calls'] or []
         if len(calls):
             call = calls[0]
@@ -812,9 +1091,13 @@ class SignaturesHandler(sublime_plugin.EventListener):
                 cls._lock.release()
 
             requested_pos = data['cursor_runes']
-            current_pos = EventDispatcher._last_selection_region['end']
+            current_pos = EventDispatcher._last_selection_region.end
 
             if content is not None and requested_pos == current_pos:
+                if (content == cls._last_popup_content and
+                        view.is_popup_visible()):
+                    return
+                cls._last_popup_content = content
                 view.show_popup(content,
                                 flags=sublime.COOPERATE_WITH_AUTO_COMPLETE,
                                 max_width=400,
@@ -838,9 +1121,27 @@ class SignaturesHandler(sublime_plugin.EventListener):
                 keymap.keystr(keymap.get('kite_toggle_popular_patterns')),
         }
 
-        return htmlmin.minify(cls._template.render(css=cls._css, call=call,
-                                                   **opts),
-                              remove_all_empty_space=True)
+        # The call content is hashed wholesale: a name/arg_index pair is not
+        # enough to identify a call, since two different functions sharing a
+        # short name at the same argument would otherwise serve each other's
+        # cached popup. Hashing is still far cheaper than the Jinja render
+        # plus htmlmin pass it avoids.
+        key = (hashlib.md5(jsonutil.dumps(call)).hexdigest(),
+               opts['show_popular_patterns'],
+               opts['show_keyword_arguments'],
+               opts['keyword_argument_highlighted'])
+
+        if (not is_development() and key == cls._last_render_key and
+                cls._last_render_content is not None):
+            return cls._last_render_content
+
+        content = htmlmin.minify(cls._template.render(css=cls._css, call=call,
+                                                      **opts),
+                                 remove_all_empty_space=True)
+
+        cls._last_render_key = key
+        cls._last_render_content = content
+        return content
 
     @classmethod
     def _rerender(cls):
@@ -850,6 +1151,7 @@ class SignaturesHandler(sublime_plugin.EventListener):
             cls._lock.release()
 
         if content is not None:
+            cls._last_popup_content = content
             cls._view.show_popup(content,
                                  flags=sublime.COOPERATE_WITH_AUTO_COMPLETE,
                                  max_width=400,
@@ -898,8 +1200,8 @@ class SignaturesHandler(sublime_plugin.EventListener):
     def _event_data(view, location):
         return {
             'editor': 'sublime3',
-            'filename': realpath(view.file_name()),
-            'text': view.substr(sublime.Region(0, view.size())),
+            'filename': _cached_realpath(view.file_name()),
+            'text': _view_text(view),
             'cursor_runes': location,
         }
 
@@ -943,7 +1245,7 @@ class HoverHandler(sublime_plugin.EventListener):
             return (points, None)
 
         try:
-            resp_data = json.loads(body.decode('utf-8'))
+            resp_data = jsonutil.loads(body)
             symbol = None if not resp_data['symbol'] else resp_data['symbol'][0]
 
             if symbol and render:
@@ -969,7 +1271,7 @@ class HoverHandler(sublime_plugin.EventListener):
         if resp.status != 200 or not body:
             return
 
-        resp_data = json.loads(body.decode('utf-8'))
+        resp_data = jsonutil.loads(body)
 
         if resp_data['symbol'] is None:
             return
@@ -1007,7 +1309,7 @@ class HoverHandler(sublime_plugin.EventListener):
 
             if view is not None and point is not None:
                 line, col = view.rowcol(point)
-                filename = realpath(view.file_name())
+                filename = _cached_realpath(view.file_name())
                 defs = [d for d in defs
                         if d[0] != filename or d[2][0] != line + 1]
                 refs = [r for r in refs
@@ -1058,8 +1360,8 @@ class HoverHandler(sublime_plugin.EventListener):
     @staticmethod
     def _event_url(view, point):
         editor = 'sublime3'
-        filename = quote(path_for_url(realpath(view.file_name())))
-        hash_ = _md5(view.substr(sublime.Region(0, view.size())))
+        filename = quote(path_for_url(_cached_realpath(view.file_name())))
+        hash_ = _md5(_view_text(view))
         return ('/api/buffer/{}/{}/{}/hover?cursor_runes={}'
                 .format(editor, filename, hash_, point))
 
@@ -1111,14 +1413,14 @@ class StatusHandler(sublime_plugin.EventListener):
 
         try:
             url = ('/clientapi/status?filename={}'
-                   .format(quote(realpath(view.file_name()))))
+                   .format(quote(_cached_realpath(view.file_name()))))
             resp, body = requests.kited_get(url)
 
             if resp.status != 200 or not body:
                 view.set_status(cls._status_key,
                                 cls._brand_status('Server error'))
             else:
-                resp_data = json.loads(body.decode('utf-8'))
+                resp_data = jsonutil.loads(body)
                 status = resp_data['status']
                 if status == 'noIndex':
                     status = 'Ready (unindexed)'
@@ -1157,7 +1459,7 @@ class MaxFileSizeUpdater(sublime_plugin.EventListener):
             resp, body = requests.kited_get(
                 '/clientapi/settings/max_file_size_kb')
             if resp.status == 200 and body:
-                max_file_size_kb = json.loads(body.decode('utf-8'))
+                max_file_size_kb = jsonutil.loads(body)
                 MAX_FILE_SIZE = max_file_size_kb << 10
         except:
             pass
@@ -1,3 +1,6 @@
+import time
+from threading import Lock
+
 from ..lib.errors import ExpectedError
 
 class Languages:
@@ -36,6 +39,15 @@ class Extensions:
     SH = ".sh"
     PHP = ".php"
 
+EXTS_TO_LANG = {
+    Extensions.PY: Languages.PYTHON,
+    Extensions.PYW: Languages.PYTHON,
+    Extensions.GO: Languages.GO,
+    Extensions.JS: Languages.JAVASCRIPT,
+    Extensions.JSX: Languages.JAVASCRIPT,
+    Extensions.VUE: Languages.JAVASCRIPT,
+}
+
 SUPPORTED_EXTS = set([
         Extensions.PY,
         Extensions.PYW,
@@ -62,3 +74,72 @@ SUPPORTED_EXTS = set([
         Extensions.SH,
         Extensions.PHP
 ])
+
+# Maps extensions to `(timestamp, ttl, enabled)` tuples so that repeated
+# checks within the TTL window become dict lookups instead of HTTP requests.
+_ENABLED_CACHE = {}
+_ENABLED_CACHE_LOCK = Lock()
+_CACHE_TTL = 30.0
+# Errors are cached with a shorter TTL so that a down copilot is not hammered
+# with retries but recovery is still picked up quickly.
+_ERROR_CACHE_TTL = 5.0
+
+# Extensions with a refresh currently queued or in flight, so that an expired
+# entry queries the copilot once per lapse rather than once per caller.
+_PENDING_REFRESHES = set()
+
+
+def kited_ext_enabled(ext):
+    """Checks whether Kite has the language for the given file extension
+    enabled. Python is always enabled, so the check short-circuits without
+    hitting the copilot. Results are cached per extension and refreshed in
+    the background when the TTL lapses, so this function never blocks on
+    HTTP and is safe to call on the UI thread. Until the first response for
+    an extension lands, it is optimistically treated as enabled, matching
+    the behavior before this gate existed.
+    """
+    if ext in (Extensions.PY, Extensions.PYW):
+        return True
+
+    now = time.monotonic()
+    cached = _ENABLED_CACHE.get(ext)
+    if cached is None or now - cached[0] >= cached[1]:
+        _queue_enabled_refresh(ext)
+
+    return cached[2] if cached is not None else True
+
+
+def _queue_enabled_refresh(ext):
+    from ..lib import deferred
+
+    with _ENABLED_CACHE_LOCK:
+        if ext in _PENDING_REFRESHES:
+            return
+        _PENDING_REFRESHES.add(ext)
+
+    deferred.defer(_refresh_ext_enabled, ext)
+
+
+def _refresh_ext_enabled(ext):
+    from ..lib import jsonutil, requests
+
+    now = time.monotonic()
+    try:
+        resp, body = requests.kited_get('/clientapi/languages')
+        if resp.status == 200 and body:
+            langs = jsonutil.loads(body) or []
+            lang = EXTS_TO_LANG.get(ext)
+            enabled = (lang is not None and
+                       lang.lower() in (l.lower() for l in langs))
+        else:
+            enabled = False
+        ttl = _CACHE_TTL
+    except (ExpectedError, ValueError):
+        enabled = False
+        ttl = _ERROR_CACHE_TTL
+    finally:
+        with _ENABLED_CACHE_LOCK:
+            _PENDING_REFRESHES.discard(ext)
+
+    with _ENABLED_CACHE_LOCK:
+        _ENABLED_CACHE[ext] = (now, ttl, enabled)
@@ -1,10 +1,9 @@
-import json
 import random
 import socket
-from http.client import CannotSendRequest, HTTPConnection
+from http.client import BadStatusLine, CannotSendRequest, HTTPConnection
 from threading import Lock
 
-from ..lib import settings
+from ..lib import jsonutil, settings
 from ..lib.errors import ExpectedError
 
 _KITED_HOST = 'localhost'
@@ -21,6 +20,7 @@ _RESET_EXCEPTIONS = (
     ConnectionRefusedError,
     ConnectionResetError,
     OSError,
+    BadStatusLine,
     CannotSendRequest,
 )
 
@@ -48,13 +48,14 @@ def kited_get(path):
 def kited_post(path, data=None):
     """Makes a POST request to a Kite endpoint specified by the `path`
     argument. The `data` argument is JSON-serialized and used as the request
-    body. Returns the response and response body as a tuple.
+    body; callers may also pass pre-encoded `bytes` to be sent as-is.
+    Returns the response and response body as a tuple.
     """
     conn, lock, idx = _get_connection()
 
     try:
         conn.request('POST', path, headers={'Connection': 'keep-alive'},
-                     body=(json.dumps(data) if data is not None else None))
+                     body=_encode_body(data))
         resp = conn.getresponse()
         body = resp.read()
     except _IGNORE_EXCEPTIONS as exc:
@@ -68,6 +69,44 @@ def kited_post(path, data=None):
         lock.release()
 
 
+def kited_post_batch(calls):
+    """Makes several POST requests back-to-back over a single keep-alive
+    connection. The `calls` argument is a list of `(path, data)` tuples in
+    which each `data` is JSON-serialized and used as the request body.
+    Returns a list of `(resp, body)` tuples in the same order. Compared to
+    separate `kited_post` calls, this pays the connection acquisition cost
+    only once for the whole batch.
+    """
+    conn, lock, idx = _get_connection()
+
+    try:
+        results = []
+        for path, data in calls:
+            conn.request('POST', path, headers={'Connection': 'keep-alive'},
+                         body=_encode_body(data))
+            resp = conn.getresponse()
+            results.append((resp, resp.read()))
+    except _IGNORE_EXCEPTIONS as exc:
+        raise ExpectedError(exc, str(exc))
+    except _RESET_EXCEPTIONS as exc:
+        _reset_connection(idx)
+        raise ExpectedError(exc, str(exc))
+    else:
+        return results
+    finally:
+        lock.release()
+
+
+def _encode_body(data):
+    """Encodes a request body to `bytes`. Serializing directly to bytes
+    avoids http.client having to encode an intermediate str copy of the
+    payload, which matters for event bodies carrying whole buffers.
+    """
+    if data is None or isinstance(data, bytes):
+        return data
+    return jsonutil.dumps(data)
+
+
 def _acquire_lock():
     idx = -1
     lock = None